@@ -0,0 +1,41 @@
+from importlib import import_module
+from amaranth.sim import *
+from amaranth_boards.ice40_hx8k_b_evn import ICE40HX8KBEVNPlatform
+from utils import Harness, Selector, UartWrapper, read_stream, write_stream
+from argparse import ArgumentParser, FileType
+
+def make_selector(days):
+    # The header byte of each job is the day number
+    return Selector({day: import_module(f"day{day}").Solution() for day in days})
+
+def cmd_test(args):
+    dut = Harness(make_selector(args.days))
+    sim = Simulator(dut)
+    sim.add_clock(1e-6)
+    sim.add_testbench(write_stream(bytes([args.day]) + args.data.read(), dut.i))
+    sim.add_testbench(read_stream(dut.o))
+    with sim.write_vcd(args.vcd):
+        sim.run_until(args.time, run_passive=True)
+    print()
+
+def cmd_build(args):
+    ICE40HX8KBEVNPlatform().build(UartWrapper(Harness(make_selector(args.days))), do_program=args.program)
+
+def main():
+    parser = ArgumentParser()
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build")
+    build_parser.set_defaults(func = cmd_build)
+    build_parser.add_argument("--program", dest="program", default=False, action="store_true")
+    build_parser.add_argument("--days", dest="days", type=int, nargs="+", default=[1, 7])
+    test_parser = subparsers.add_parser("test")
+    test_parser.set_defaults(func = cmd_test)
+    test_parser.add_argument("--days", dest="days", type=int, nargs="+", default=[1, 7])
+    test_parser.add_argument("--day", dest="day", type=int, required=True)
+    test_parser.add_argument("--time", dest="time", type=float, default=1e-3)
+    test_parser.add_argument("--vcd", dest="vcd", default="multi.vcd")
+    test_parser.add_argument("--data", dest="data", default=None, type=FileType("rb"))
+    args = parser.parse_args()
+    return args.func(args)
+
+if __name__ == "__main__": main()
@@ -290,4 +290,61 @@ class Harness(Elaboratable):
                     m.d.comb += reset.eq(1)
                     m.next = "RUNNING"
 
-        return m
\ No newline at end of file
+        return m
+
+class Selector(Elaboratable):
+    """ Puts several solutions behind one interface, the first byte of each job selects the solution.
+        Solutions which are not selected are held in reset. """
+    def __init__(self, solutions):
+        self.i = Stream(8)
+        self.done = Signal()
+        self.error = Signal()
+        self.part_1 = Signal(64)
+        self.part_2 = Signal(64)
+        self.solutions = solutions # Dict of header byte -> solution
+
+    def elaborate(self, platform):
+        m = Module()
+
+        # One-hot selection of the running solution, all zero while waiting for a header
+        select = Signal(len(self.solutions))
+
+        for idx, (header, solution) in enumerate(self.solutions.items()):
+            # Hold idle solutions in reset
+            reset = Signal(name=f"reset_{header}")
+            m.d.comb += reset.eq(~select[idx])
+            m.submodules[f"solution_{header}"] = ResetInserter(reset)(solution)
+
+            # Only the selected solution sees the input
+            m.d.comb += [
+                solution.i.valid.eq(self.i.valid & select[idx]),
+                solution.i.data.eq(self.i.data),
+            ]
+
+            with m.If(select[idx]):
+                m.d.comb += [
+                    self.i.ready.eq(solution.i.ready),
+                    self.done.eq(solution.done),
+                    self.error.eq(solution.error),
+                    self.part_1.eq(solution.part_1),
+                    self.part_2.eq(solution.part_2),
+                ]
+
+        with m.FSM("HEADER") as fsm:
+            # Consume the header byte and select the solution, unknown headers are an error
+            with m.State("HEADER"):
+                m.d.comb += self.i.ready.eq(1)
+                with m.If(self.i.valid):
+                    with m.Switch(self.i.data):
+                        for idx, header in enumerate(self.solutions):
+                            with m.Case(header):
+                                m.d.sync += select.eq(1 << idx)
+                                m.next = "RUNNING"
+                        with m.Default():
+                            m.next = "ERROR"
+            with m.State("RUNNING"):
+                pass # Wait for the harness to reset us when the job is done
+            with m.State("ERROR"):
+                m.d.comb += self.error.eq(1)
+
+        return m